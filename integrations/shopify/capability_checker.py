@@ -83,10 +83,15 @@ class ShopifyCapabilityChecker:
         """Get path to capability profile file"""
         return self.storage_path / self.tenant_id / "shopify_capabilities.json"
     
-    async def check_all_capabilities(self) -> ShopifyCapabilityProfile:
+    async def check_all_capabilities(self, probe_writes: bool = True) -> ShopifyCapabilityProfile:
         """
         Test all capabilities and return a complete profile.
         
+        Args:
+            probe_writes: Run checks that create store data (a draft product
+                that is deleted again). When False, product_write is reported
+                as not enabled without being probed.
+        
         Returns:
             ShopifyCapabilityProfile with all capability flags set
         """
@@ -106,7 +111,15 @@ class ShopifyCapabilityChecker:
         capabilities.append(product_read)
         profile.product_read = product_read.enabled
         
-        product_write = await self._check_product_write()
+        if probe_writes:
+            product_write = await self._check_product_write()
+        else:
+            product_write = ShopifyCapability(
+                name="product_write",
+                scope="write_products",
+                enabled=False,
+                error="Not probed (write checks disabled)",
+            )
         capabilities.append(product_write)
         profile.product_write = product_write.enabled
         
@@ -96,6 +96,7 @@ class ShopifyAdminClient:
         access_token: str,
         api_version: str = None,
         timeout: float = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize Shopify Admin API client.
@@ -105,6 +106,8 @@ class ShopifyAdminClient:
             access_token: Shopify Admin API access token
             api_version: API version (default: 2025-10)
             timeout: Request timeout in seconds
+            http_client: Optional shared AsyncClient to reuse pooled connections.
+                The caller owns its lifecycle; close() leaves it open.
         """
         # Normalize shop domain
         self.shop_domain = self._normalize_domain(shop_domain)
@@ -119,8 +122,16 @@ class ShopifyAdminClient:
         self._call_timestamps: List[float] = []
         self._rate_limit_lock = asyncio.Lock()
         
-        # HTTP client (lazy initialization)
-        self._client: Optional[httpx.AsyncClient] = None
+        # Auth headers are sent per request so a shared client can serve many shops
+        self._headers = {
+            "X-Shopify-Access-Token": self.access_token,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        
+        # HTTP client (lazy initialization unless a shared client is injected)
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
         
         logger.info(f"Initialized ShopifyAdminClient for {self.shop_domain} (API v{self.api_version})")
     
@@ -146,16 +157,17 @@ class ShopifyAdminClient:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
-                headers={
-                    "X-Shopify-Access-Token": self.access_token,
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
+                headers=self._headers,
             )
+            self._owns_client = True
         return self._client
     
     async def close(self):
         """Close HTTP client"""
+        if not self._owns_client:
+            # Shared client is managed by the caller
+            self._client = None
+            return
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -247,6 +259,7 @@ class ShopifyAdminClient:
                     url=url,
                     params=params,
                     json=json_data,
+                    headers=self._headers,
                     timeout=timeout or self.timeout,
                 )
                 
@@ -405,7 +418,7 @@ class ShopifyAdminClient:
         while True:
             await self._wait_for_rate_limit()
             
-            response = await client.get(url, params=params)
+            response = await client.get(url, params=params, headers=self._headers, timeout=self.timeout)
             
             if response.status_code != 200:
                 break
@@ -70,6 +70,12 @@ from .widgets import (
     render_quick_actions,
 )
 
+from .seo_fixtures import (
+    SEO_BASE_TOPICS,
+    SEO_ADVANCED_TOPICS,
+    SEO_TOPICS_VERSION,
+)
+
 __all__ = [
     # Theme
     "get_custom_css",
@@ -133,4 +139,9 @@ __all__ = [
     
     # Legacy
     "render_quick_actions",
+    
+    # SEO Fixtures
+    "SEO_BASE_TOPICS",
+    "SEO_ADVANCED_TOPICS",
+    "SEO_TOPICS_VERSION",
 ]
@@ -0,0 +1,44 @@
+"""
+Mock SEO Fixtures for Shopify Platform
+Demo topic data for the SEO content tools, built once per process.
+"""
+
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+# =============================================================================
+# Base Topics - parsed once at import
+# =============================================================================
+_TOPICS_JSON = """[
+    {"title": "Ultimate Guide to Wireless Bluetooth Headphones", "keywords": ["wireless headphones", "bluetooth headphones", "best wireless headphones"], "traffic_potential": 2400, "content_angle": "Educational Guide", "related_product": "Premium Wireless Headphones"},
+    {"title": "Gaming Keyboard Buying Guide 2024", "keywords": ["gaming keyboard", "mechanical keyboard", "keyboard guide"], "traffic_potential": 1800, "content_angle": "Buying Guide", "related_product": "RGB Gaming Keyboard"},
+    {"title": "Fast Charging Technology Explained", "keywords": ["fast charging", "USB-C charger", "quick charge"], "traffic_potential": 1200, "content_angle": "Educational", "related_product": "USB-C Fast Charger"},
+    {"title": "Best Smartphone Accessories for 2024", "keywords": ["smartphone accessories", "phone accessories", "mobile accessories"], "traffic_potential": 3200, "content_angle": "Product Roundup", "related_product": "Phone Accessories Bundle"},
+    {"title": "How to Choose the Perfect Laptop Stand", "keywords": ["laptop stand", "ergonomic laptop stand", "laptop accessories"], "traffic_potential": 900, "content_angle": "How-to Guide", "related_product": "Adjustable Laptop Stand"}
+]"""
+
+SEO_BASE_TOPICS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({**topic, 'keywords': tuple(topic['keywords'])})
+    for topic in json.loads(_TOPICS_JSON)
+)
+
+# =============================================================================
+# Advanced Topics - derived variants served after the base set
+# =============================================================================
+SEO_ADVANCED_TOPICS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({
+        **topic,
+        'title': f"{topic['title']} - Advanced Edition",
+        'traffic_potential': int(topic['traffic_potential'] * 0.8),
+    })
+    for topic in SEO_BASE_TOPICS
+)
+
+# =============================================================================
+# Fixture Version - content hash for persisted caches keyed on these topics
+# =============================================================================
+SEO_TOPICS_VERSION: str = hashlib.sha1(
+    repr([dict(topic) for topic in SEO_BASE_TOPICS + SEO_ADVANCED_TOPICS]).encode()
+).hexdigest()[:12]
@@ -703,6 +703,26 @@ def get_custom_css() -> str:
         margin: 2rem 0;
     }}
     
+    /* Spaced rules; the margin stands in for separate <br> spacer elements */
+    .section-rule {{
+        border: none;
+        border-top: 2px solid var(--surface-3);
+        margin: 3rem 0;
+    }}
+    
+    .panel-rule {{
+        border: none;
+        border-top: 1px solid #444;
+        margin: 2.5rem 0;
+    }}
+    
+    /* Section spacing that replaces <br> spacer elements on the settings page;
+       containers opt in with key="spaced_<name>" (Streamlit adds .st-key-<key>) */
+    .spaced-heading,
+    [class*="st-key-spaced_"] {{
+        margin-top: 1.5rem;
+    }}
+    
     /* ===========================================
        Empty State
        =========================================== */
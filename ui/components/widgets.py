@@ -10,6 +10,7 @@ Strict Design Rules:
 • Uniform grid: 4 columns for metrics
 """
 
+import functools
 import streamlit as st
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
@@ -110,14 +111,20 @@ def render_page_header(title: str, icon: str = "◐", description: str = "") ->
     ''', unsafe_allow_html=True)
 
 
-def render_section_header(title: str, icon: str = "◐", subtitle: str = "") -> None:
-    """Section header with consistent styling"""
-    st.markdown(f'''
+@functools.lru_cache(maxsize=256)
+def _section_header_html(title: str, icon: str) -> str:
+    """Memoized section header markup keyed by (title, icon)"""
+    return f'''
     <div class="section-header">
         <div class="section-icon">{icon}</div>
         <div class="section-title">{title}</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
+
+
+def render_section_header(title: str, icon: str = "◐", subtitle: str = "") -> None:
+    """Section header with consistent styling"""
+    st.markdown(_section_header_html(title, icon), unsafe_allow_html=True)
 
 
 # =============================================================================
@@ -418,9 +425,12 @@ def render_progress_card(title: str, current: int, total: int, icon: str = "◐"
 # DIVIDERS
 # =============================================================================
 
+_DIVIDER_HTML = '<div class="divider"></div>'
+
+
 def render_divider() -> None:
     """Consistent divider line"""
-    st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+    st.markdown(_DIVIDER_HTML, unsafe_allow_html=True)
 
 
 def render_section_divider() -> None: